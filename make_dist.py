@@ -3,6 +3,15 @@ import shutil
 import subprocess
 from pathlib import Path
 
+_header_pattern = re.compile(r'WorldPopPy <img.*?>')
+
+# shields and inline example visuals are dropped from the PyPI readme
+_skip_prefixes = (
+    "[![PyPI Latest Release]",
+    "[![License]",
+    "<img src=",
+)
+
 
 def clean_readme_for_pypi():
     """
@@ -15,14 +24,11 @@ def clean_readme_for_pypi():
         readme_lines = f.readlines()
 
     # simplify header line
-    readme_lines[0] = re.sub(r'WorldPopPy <img.*?>', 'WorldPopPy README', readme_lines[0])
-
-    # remove shields
-    filtered_lines = [l for l in readme_lines if not l.startswith("[![PyPI Latest Release]")]
-    filtered_lines = [l for l in filtered_lines if not l.startswith("[![License]")]
+    readme_lines[0] = _header_pattern.sub('WorldPopPy README', readme_lines[0])
 
-    # remove example visuals
-    filtered_lines = [l for l in filtered_lines if not l.startswith("<img src=")]
+    # drop badges and example visuals in a single pass
+    # (str.startswith checks all prefixes in one C call)
+    filtered_lines = [l for l in readme_lines if not l.startswith(_skip_prefixes)]
 
     # concatenate lines
     long_description = "".join(filtered_lines)
@@ -0,0 +1,136 @@
+import asyncio
+
+import httpx
+import pytest
+
+PAYLOAD = bytes(range(256)) * 64  # 16 KiB of distinctive bytes
+
+
+class _Body(httpx.AsyncByteStream):
+    """Serve response bytes as a genuine stream, chunk by chunk."""
+
+    def __init__(self, data, chunk_size=4096):
+        self._data = data
+        self._chunk_size = chunk_size
+
+    async def __aiter__(self):
+        for pos in range(0, len(self._data), self._chunk_size):
+            yield self._data[pos:pos + self._chunk_size]
+
+
+def _make_handler(requests_seen):
+    """Return a MockTransport handler mimicking WorldPop's range support."""
+
+    def handler(request):
+        requests_seen.append(request)
+        range_header = request.headers.get("Range")
+
+        if range_header is None:
+            return httpx.Response(
+                200,
+                stream=_Body(PAYLOAD),
+                headers={"Content-Length": str(len(PAYLOAD))},
+            )
+
+        start = int(range_header.removeprefix("bytes=").rstrip("-"))
+        if start >= len(PAYLOAD):
+            return httpx.Response(416)
+
+        body = PAYLOAD[start:]
+        return httpx.Response(
+            206,
+            stream=_Body(body),
+            headers={"Content-Length": str(len(body))},
+        )
+
+    return handler
+
+
+def _run_stream(tmp_file, handler):
+    from worldpoppy.download import WorldPopDownloader
+
+    async def _main():
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            await downloader._astream_to_file(client, 'some/raster.tif', tmp_file)
+
+    with WorldPopDownloader(directory=tmp_file.parent) as downloader:
+        asyncio.run(_main())
+
+
+def test_fresh_download_streams_full_file(tmp_path):
+    requests_seen = []
+    tmp_file = tmp_path / 'raster.tif.download'
+
+    _run_stream(tmp_file, _make_handler(requests_seen))
+
+    assert tmp_file.read_bytes() == PAYLOAD
+    assert len(requests_seen) == 1
+    assert 'Range' not in requests_seen[0].headers
+
+
+def test_resumed_download_completes_partial_file(tmp_path):
+    requests_seen = []
+    tmp_file = tmp_path / 'raster.tif.download'
+    tmp_file.write_bytes(PAYLOAD[:5000])  # leftover of an interrupted transfer
+
+    _run_stream(tmp_file, _make_handler(requests_seen))
+
+    assert tmp_file.read_bytes() == PAYLOAD
+    assert len(requests_seen) == 1
+    assert requests_seen[0].headers['Range'] == 'bytes=5000-'
+
+
+def test_complete_leftover_file_restarts_after_416(tmp_path):
+    requests_seen = []
+    tmp_file = tmp_path / 'raster.tif.download'
+    tmp_file.write_bytes(PAYLOAD)  # already complete, so the resume request overshoots
+
+    _run_stream(tmp_file, _make_handler(requests_seen))
+
+    assert tmp_file.read_bytes() == PAYLOAD
+    assert len(requests_seen) == 2  # 416 on the range request, then a fresh GET
+
+
+def test_permanent_client_error_fails_fast(tmp_path):
+    requests_seen = []
+    tmp_file = tmp_path / 'raster.tif.download'
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(404)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        _run_stream(tmp_file, handler)
+
+    assert len(requests_seen) == 1  # no retries for a permanent client error
+
+
+def test_async_client_persists_across_batches(tmp_path):
+    from worldpoppy.download import WorldPopDownloader
+
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(
+            200,
+            stream=_Body(PAYLOAD),
+            headers={"Content-Length": str(len(PAYLOAD))},
+        )
+
+    with WorldPopDownloader(directory=tmp_path) as downloader:
+        downloader._aclient = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        downloader._scan_directory()
+
+        first = [('a/one.tif', tmp_path / 'one.tif', True)]
+        assert list(downloader._iter_completed_downloads(first)) == [tmp_path / 'one.tif']
+        client = downloader._get_async_client()
+
+        second = [('a/two.tif', tmp_path / 'two.tif', True)]
+        assert list(downloader._iter_completed_downloads(second)) == [tmp_path / 'two.tif']
+        assert downloader._get_async_client() is client  # the pool survives batches
+
+        # cached files short-circuit without touching the network
+        assert list(downloader._iter_completed_downloads(first)) == [tmp_path / 'one.tif']
+        assert len(requests_seen) == 2
@@ -110,3 +110,91 @@ def test_incomplete_manifest_coverage_raises():
     with pytest.raises(ValueError):
         # empty combo (incomplete coverage)
         wp_manifest_constrained(product_name=eg_prod, iso3_codes=eg_iso, years=eg_year)
+
+
+def test_bulk_year_extraction_matches_scalar():
+    from worldpoppy.manifest import extract_year, extract_years
+
+    names = ['some_dataset_2015', 'other_2020_constrained', 'ppp_2001']
+    bulk = extract_years(names)
+    assert list(bulk) == [extract_year(name) for name in names]
+
+    # names without a year identifier are flagged rather than raising
+    assert list(extract_years(['bad_name', 'foo_2020'])) == [-1, 2020]
+
+
+def _reset_manifest_caches():
+    import worldpoppy.manifest as m
+
+    m._manifest_cache = None
+    for func in (
+            m._indexed_manifest, m._iso_set, m._static_product_set,
+            m._annual_product_set, m._annual_year_set,
+            m.get_all_isos, m.get_static_product_names,
+            m.get_annual_product_names, m.get_all_annual_product_years,
+    ):
+        func.cache_clear()
+
+
+def _install_synthetic_manifest(monkeypatch, tmp_path):
+    """Point the manifest machinery at a small synthetic Feather file."""
+    import pandas as pd
+    import worldpoppy.manifest as m
+
+    records = []
+    for iso3 in ('AAA', 'BBB', 'CCC', 'DDD'):
+        records.append(dict(iso3=iso3, dataset_name='night_lights', is_annual=False, year=np.nan))
+        if iso3 == 'DDD':
+            continue  # no annual coverage for DDD
+        for year in (2019, 2020):
+            records.append(dict(iso3=iso3, dataset_name=f'pop_{year}', is_annual=True, year=float(year)))
+
+    mdf = pd.DataFrame(records)
+    mdf['idx'] = range(len(mdf))
+    mdf['country_numeric'] = '000'
+    mdf['country_name'] = mdf.iso3
+    mdf['remote_path'] = '/GIS/' + mdf.dataset_name
+    mdf['notes'] = ''
+    mdf['product_name'] = mdf.dataset_name.where(~mdf.is_annual, mdf.dataset_name.str.slice(0, -5))
+
+    fpath = tmp_path / 'manifest.feather'
+    mdf.to_feather(fpath)
+
+    monkeypatch.setattr(m, 'build_wp_manifest', lambda: None)
+    monkeypatch.setattr(m, '_cleaned_manifest_fpath', fpath)
+    _reset_manifest_caches()
+
+
+def test_constrained_fast_path_matches_mask_filter(tmp_path, monkeypatch):
+    import worldpoppy.manifest as m
+
+    _install_synthetic_manifest(monkeypatch, tmp_path)
+    try:
+        full = m.wp_manifest()
+
+        # the indexed (product, country) fast path must return the same rows
+        # as plain boolean-mask filtering over the full manifest
+        fast = m.wp_manifest('pop', ['AAA', 'CCC'], years=[2020])
+        expected = full[
+            (full.product_name == 'pop')
+            & full.iso3.isin(['AAA', 'CCC'])
+            & full.year.isin([2020])
+        ]
+        assert list(fast.idx) == list(expected.idx)
+        assert list(fast.year) == [2020, 2020]
+
+        # a static product resolves through the same indexed path
+        static = m.wp_manifest('night_lights', 'BBB')
+        assert list(static.iso3) == ['BBB']
+
+        # a known country without rows for the product yields an empty
+        # result rather than a lookup error
+        assert m.wp_manifest('pop', ['DDD']).empty
+
+        # duplicated country codes must not duplicate manifest rows
+        dup = m.wp_manifest('pop', ['AAA', 'AAA'], years=[2020])
+        assert list(dup.iso3) == ['AAA']
+        dup = m.wp_manifest_constrained('pop', ['AAA', 'AAA'], years=[2020])
+        assert list(dup.iso3) == ['AAA']
+    finally:
+        _reset_manifest_caches()
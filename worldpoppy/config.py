@@ -14,7 +14,8 @@ __all__ = [
 ]
 
 DEFAULT_CACHE_DIR = Path.home() / ".cache" / "worldpoppy"
-DEFAULT_MAX_CONCURRENCY = max(1, cpu_count() - 2)
+DEFAULT_MAX_CONCURRENCY = max(1, cpu_count() - 1)
+MAX_CONCURRENCY_CAP = 16
 ROOT_DIR = Path(__file__).parent
 ASSET_DIR = ROOT_DIR / 'assets'
 WGS84_CRS = 'EPSG:4326'
@@ -45,7 +46,8 @@ def get_max_concurrency():
     Note
     ----
     You can override the default concurrency limit by setting the "WORLDPOPPY_MAX_CONCURRENCY"
-    environment variable.
+    environment variable. The returned value is always capped at 16 to avoid
+    thread thrashing on many-core machines.
     """
     num_threads = os.getenv("WORLDPOPPY_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)
-    return int(num_threads)
+    return min(MAX_CONCURRENCY_CAP, int(num_threads))
@@ -23,6 +23,10 @@ Main methods
 
 """
 
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import ClassVar, Optional, Any
@@ -30,7 +34,6 @@ from typing import ClassVar, Optional, Any
 import backoff
 import httpx
 import nest_asyncio
-import pandas as pd
 from httpx import HTTPError
 from pqdm.threads import pqdm
 from tqdm.auto import tqdm
@@ -45,6 +48,23 @@ __all__ = [
     "purge_cache",
 ]
 
+# Stream responses in 1 MiB chunks (rather than httpx's ~64KB default) and
+# buffer local writes in 8 MiB blocks. Larger chunks mean fewer Python-level
+# iterations and syscalls per raster, which matters for WorldPop files that
+# often span hundreds of megabytes.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+WRITE_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Partial '.download' files younger than this (in seconds) are kept around so
+# interrupted transfers can be resumed via HTTP range requests; older ones
+# are considered abandoned and deleted during cache repair.
+STALE_DOWNLOAD_MAX_AGE = 24 * 3600
+
+# Number of files handled per worker dispatch during dry-run size checking.
+# Batching keeps the per-task queueing overhead from dominating when many
+# small rasters are requested.
+DRY_RUN_BATCH_SIZE = 8
+
 
 class DownloadError(Exception):
     """Raised when one or more files fail to download."""
@@ -104,10 +124,79 @@ class WorldPopDownloader:
             provided (default), rasters are downloaded into the local cache
             directory (see `get_cache_dir`).
         """
-        nest_asyncio.apply()
-
         self.directory = Path(directory) if directory is not None else get_cache_dir()
 
+        # lazily populated set of raster files known to exist locally,
+        # plus the directory mtime observed when that set was last valid
+        self._present: Optional[set] = None
+        self._scan_mtime: Optional[float] = None
+
+        # Share one HTTP client across all worker threads. This avoids a fresh
+        # TCP+TLS handshake per raster and lets HTTP/2 multiplex concurrent
+        # streams over pooled connections.
+        self._client = httpx.Client(
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=2 * get_max_concurrency(),
+                max_keepalive_connections=get_max_concurrency(),
+            ),
+        )
+
+        # Lazily created private event loop and async HTTP client for the
+        # streaming download path. Both live as long as the downloader, so
+        # warmed-up TCP+TLS connections in the async pool are reused across
+        # `download` calls instead of being re-established per batch.
+        self._aloop = None
+        self._aclient = None
+
+    def _get_event_loop(self):
+        """Return the downloader's private, long-lived event loop."""
+        if self._aloop is None:
+            self._aloop = asyncio.new_event_loop()
+        return self._aloop
+
+    def _get_async_client(self):
+        """
+        Return the shared asynchronous HTTP client, creating it on first use.
+
+        The client must only ever be driven from the downloader's private
+        event loop (see `_get_event_loop`), which keeps its connection pool
+        valid across batches.
+        """
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(30.0, connect=10.0),
+                limits=httpx.Limits(
+                    max_connections=2 * get_max_concurrency(),
+                    max_keepalive_connections=get_max_concurrency(),
+                ),
+            )
+        return self._aclient
+
+    def close(self):
+        """Close the shared HTTP clients and their pooled connections."""
+        self._client.close()
+        if self._aclient is not None:
+            self._get_event_loop().run_until_complete(self._aclient.aclose())
+            self._aclient = None
+        if self._aloop is not None:
+            self._aloop.close()
+            self._aloop = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:  # noqa; interpreter may be shutting down
+            pass
+
     def download(
             self,
             product_name,
@@ -148,31 +237,29 @@ class WorldPopDownloader:
             If not all requested files were successfully downloaded
         """
 
-        # delete artefacts from previously interrupted downloads
-        _repair_cache()
-
-        # fetch download manifest (will validate user query)
-        filtered_mdf = wp_manifest_constrained(product_name, iso3_codes, years)
-
-        # assemble URLs and local paths
-        data = filtered_mdf[['product_name', 'iso3', 'year']].values
-        local_paths = [self._build_local_fpath(*tup) for tup in data]
-        remote_paths = filtered_mdf['remote_path'].tolist()
-
-        # prepare arguments for parallel processing
-        args = [(r, l, skip_download_if_exists) for r, l in zip(remote_paths, local_paths)]
+        args, local_paths = self._resolve_download_targets(
+            product_name, iso3_codes, years, skip_download_if_exists
+        )
 
         if dry_run:
             print("Dry run: calculating number and size of files to download...\n")
 
-            res = pqdm(
-                args,
-                self._get_required_file_download_size,  # noqa
+            # group files into batches so each worker thread handles several
+            # HEAD requests per dispatch, rather than paying the per-task
+            # overhead once per file
+            batches = [
+                args[i:i + DRY_RUN_BATCH_SIZE]
+                for i in range(0, len(args), DRY_RUN_BATCH_SIZE)
+            ]
+
+            res_batches = pqdm(
+                batches,
+                self._get_batch_download_sizes,  # noqa
                 n_jobs=get_max_concurrency() * 4,  # these jobs are cheap
-                argument_type="args",
                 desc="Checking download sizes...",
                 leave=False,
             )
+            res = [r for batch in res_batches for r in batch]
 
             if errors := [r.error for r in res if not r.success]:
                 formatted = '\n'.join(f"- {e}" for e in errors)
@@ -187,78 +274,441 @@ class WorldPopDownloader:
             print(f"Total est. download size: {round(total_size / 1e6, 2):,} MB")
 
         else:
-            res = pqdm(
-                args,
-                self._download_file,  # noqa
-                n_jobs=get_max_concurrency(),
-                argument_type="args",
-                desc="Downloading...",
-                leave=False,
-            )
+            completed = sorted(self._iter_completed_downloads(args))
+            assert len(completed) == len(local_paths)
+            return completed
 
-            if errors := [r.error for r in res if not r.success]:
-                formatted = '\n'.join(f"- {e}" for e in errors)
-                raise DownloadError(
-                    f"{len(errors)} download(s) failed. Details:\n{formatted}"
-                )
+        return sorted(local_paths)
 
-            assert len(res) == len(local_paths)
+    def download_iter(
+            self,
+            product_name,
+            iso3_codes,
+            years=None,
+            skip_download_if_exists=True
+    ):
+        """
+        Lazily download a collection of country-specific WorldPop rasters,
+        yielding each local path as soon as its download completes.
 
-        return sorted(local_paths)
+        Unlike `download`, results are yielded in completion order rather
+        than lexical order, so downstream processing (e.g. opening rasters
+        with xarray) can start before the full batch has finished.
+
+        Parameters
+        ----------
+        product_name : str
+            The name of the WorldPop data product of interest.
+        iso3_codes : str or List[str]
+            One or more three-letter ISO codes, denoting the countries of interest.
+        years : int or List[int] or str, optional
+            For annual data products, the year (or years) of interest, or the 'all'
+            keyword (str). For static data products, this argument must be None
+            (default).
+        skip_download_if_exists : bool, optional, default=True
+            Whether to skip downloading raster files that already exist locally.
+
+        Yields
+        ------
+        pathlib.Path
+            The local path of each raster, in completion order.
+
+        Raises
+        ------
+        DownloadError
+            If not all requested files were successfully downloaded. Raised
+            only once all remaining downloads have finished.
+        """
+        args, _ = self._resolve_download_targets(
+            product_name, iso3_codes, years, skip_download_if_exists
+        )
+        yield from self._iter_completed_downloads(args)
+
+    def _resolve_download_targets(
+            self,
+            product_name,
+            iso3_codes,
+            years,
+            skip_download_if_exists
+    ):
+        """
+        Validate a download query and map it to per-file download arguments.
+
+        Also triggers the one-off scan of the download directory (see
+        `_scan_directory`).
+
+        Returns
+        -------
+        tuple
+            A list of (remote_path, local_path, skip_if_exists) tuples and
+            the list of all local target paths.
+        """
+
+        # Scan the download directory once, deleting artefacts from previously
+        # interrupted downloads and recording which rasters already exist
+        # locally. Repeated `download` calls reuse the cached scan instead of
+        # re-walking the tree and re-stat'ing every candidate path. A single
+        # stat of the directory itself detects external modifications and
+        # triggers a re-scan.
+        if self._present is None or self._dir_mtime() != self._scan_mtime:
+            self._scan_directory()
+
+        # fetch download manifest (will validate user query)
+        filtered_mdf = wp_manifest_constrained(product_name, iso3_codes, years)
+
+        # assemble URLs and local paths
+        local_paths = self._build_local_fpaths(filtered_mdf)
+        remote_paths = filtered_mdf['remote_path'].tolist()
+
+        # Prepare arguments for parallel processing, deduplicated by local
+        # target path: two concurrent streams writing to the same temporary
+        # file would corrupt each other's partial output.
+        args = []
+        seen_local = set()
+        for remote_path, local_path in zip(remote_paths, local_paths):
+            if local_path in seen_local:
+                continue
+            seen_local.add(local_path)
+            args.append((remote_path, local_path, skip_download_if_exists))
+        local_paths = [local_path for _, local_path, _ in args]
+
+        return args, local_paths
+
+    def _iter_completed_downloads(self, args):
+        """
+        Drive the asynchronous downloads from synchronous code, yielding each
+        local path as its transfer completes.
+
+        Parameters
+        ----------
+        args : list of tuple
+            One (remote_path, local_path, skip_if_exists) tuple per raster.
+
+        Yields
+        ------
+        pathlib.Path
+
+        Raises
+        ------
+        DownloadError
+            If one or more downloads failed, raised after all remaining
+            transfers have finished.
+        """
+        # Rasters known to exist locally are yielded straight away; only the
+        # remainder needs to touch the network. In the common re-run case
+        # where everything is cached, no event loop or HTTP client is
+        # created at all.
+        to_do = []
+        for tup in args:
+            _, local_path, skip_if_exists = tup
+            if skip_if_exists and local_path in self._present:
+                yield local_path
+            else:
+                to_do.append(tup)
+
+        if not to_do:
+            return
+
+        # Only patch asyncio when we are actually inside a running event loop
+        # (e.g. in Jupyter), where running a nested loop would otherwise
+        # raise. Applying the nest_asyncio monkey-patch unconditionally at
+        # construction time would affect every asyncio user in the process.
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            nest_asyncio.apply()
+
+        agen = self._download_as_completed(to_do)
+        loop = self._get_event_loop()
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(agen.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            # Finalize the async generator even when the caller abandons
+            # iteration early, so no tasks linger on the long-lived loop.
+            loop.run_until_complete(agen.aclose())
+            # fresh downloads bumped the directory mtime; re-record it so the
+            # next `download` call does not mistake our own writes for an
+            # external modification
+            self._scan_mtime = self._dir_mtime()
+
+    def _scan_directory(self):
+        """
+        Walk the download directory in a single pass, deleting stale '.download'
+        artefacts left behind by interrupted downloads and recording which
+        raster files are already present locally.
+
+        Recent '.download' files are kept so they can be resumed via HTTP
+        range requests (see `_astream_to_file`).
+        """
+        present = set()
+        stale = []
+
+        now = time.time()
+        for entry in _iter_files(self.directory):
+            if entry.name.endswith('.tif'):
+                present.add(Path(entry.path))
+            elif entry.name.endswith('.download'):
+                if now - entry.stat().st_mtime > STALE_DOWNLOAD_MAX_AGE:
+                    stale.append(Path(entry.path))
+
+        for path in stale:
+            try:
+                path.unlink()
+            except Exception as e:
+                print(f"Failed to delete cached file at {path}: {e}")
+
+        self._present = present
+        self._scan_mtime = self._dir_mtime()
+
+    def _dir_mtime(self):
+        """
+        Return the modification time of the download directory, or None if
+        the directory does not exist (yet).
+        """
+        try:
+            return os.stat(self.directory).st_mtime
+        except OSError:
+            return None
+
+    def invalidate_cache(self):
+        """
+        Discard the cached directory scan, forcing a fresh re-scan on the
+        next `download` call. Call this if cached rasters were added or
+        removed behind the downloader's back.
+        """
+        self._present = None
+
+    async def _download_as_completed(self, args):
+        """
+        Download all requested WorldPop rasters over a single event loop,
+        with concurrency bounded by `get_max_concurrency`. Local paths are
+        yielded in completion order.
+
+        Parameters
+        ----------
+        args : list of tuple
+            One (remote_path, local_path, skip_if_exists) tuple per raster.
+
+        Yields
+        ------
+        pathlib.Path
 
-    @backoff.on_exception(backoff.expo, HTTPError)
-    def _download_file(
+        Raises
+        ------
+        DownloadError
+            If one or more downloads failed, raised after all remaining
+            transfers have finished.
+        """
+        semaphore = asyncio.Semaphore(get_max_concurrency())
+        errors = []
+
+        # One aggregate byte counter for the whole batch. Per-file bars would
+        # contend on tqdm's internal lock and flood the terminal when many
+        # rasters download concurrently. The bar's total grows as each
+        # response reveals its Content-Length.
+        with tqdm(
+                total=0,
+                unit="B",
+                unit_scale=True,
+                leave=False,
+                mininterval=0.5,
+                desc=f"Downloading {len(args)} file(s)...",
+        ) as pbar:
+            client = self._get_async_client()
+
+            async def _guarded(task_args):
+                async with semaphore:
+                    return task_args[1], await self._adownload_file(
+                        client, *task_args, pbar=pbar
+                    )
+
+            tasks = [asyncio.ensure_future(_guarded(tup)) for tup in args]
+            try:
+                for future in asyncio.as_completed(tasks):
+                    local_path, result = await future
+                    if result.success:
+                        yield local_path
+                    else:
+                        errors.append(result.error)
+            finally:
+                # no-op for finished tasks; stops in-flight transfers if the
+                # consumer abandons the stream early
+                for task in tasks:
+                    task.cancel()
+
+        if errors:
+            formatted = '\n'.join(f"- {e}" for e in errors)
+            raise DownloadError(
+                f"{len(errors)} download(s) failed. Details:\n{formatted}"
+            )
+
+    async def _adownload_file(
             self,
+            client,
             remote_path,
             local_path,
-            skip_if_exists=True
+            skip_if_exists=True,
+            pbar=None
     ):
         """
         Download a WorldPop raster with automatic retries.
 
         Parameters
         ----------
+        client : httpx.AsyncClient
+            The shared HTTP client over which to stream the download.
         remote_path : str
             The remote path to the WorldPop raster file to be downloaded.
         local_path : Path
             The local file path where the raster will be saved.
         skip_if_exists : bool, optional, default=True
             Whether to skip the download if the file already exists locally.
+        pbar : tqdm.tqdm, optional
+            A shared progress bar tracking aggregate downloaded bytes.
 
         Returns
         -------
         DownloadResult
         """
-        if local_path.is_file() and skip_if_exists:
+        if skip_if_exists and local_path in self._present:
             # nothing to do
             return DownloadResult(success=True)
 
-        remote_url = f"{self.URL}/{remote_path}"
-        remote_fname = remote_path.split("/")[-1]
         local_path.parent.mkdir(parents=True, exist_ok=True)
 
         # download the raster to a temporary path in the same directory
         tmp_path = local_path.with_suffix(local_path.suffix + ".download")
 
         try:
-            with open(tmp_path, "wb+") as f:
-                with httpx.stream("GET", remote_url) as response:
-                    total = int(response.headers["Content-Length"])
-                    with tqdm(total=total, unit="B", unit_scale=True, leave=False) as pbar:
-                        pbar.set_description(f"Downloading {remote_fname}...")
-                        for chunk in response.iter_raw():
-                            f.write(chunk)
-                            pbar.update(len(chunk))
-                    response.raise_for_status()
+            await self._astream_to_file(client, remote_path, tmp_path, pbar)
         except Exception as e:
             return DownloadResult(success=False, error=e)
         else:
-            # only after the download has finished do we rename the temporary file to
-            # its proper name. In this way, crashing downloads will  not corrupt the
-            # local cache.
-            tmp_path.rename(local_path)
+            # Only after the download has finished do we rename the temporary file to
+            # its proper name. In this way, crashing downloads will not corrupt the
+            # local cache. `os.replace` is atomic and, unlike `Path.rename`,
+            # overwrites an existing target on all platforms.
+            os.replace(tmp_path, local_path)
+            self._present.add(local_path)
             return DownloadResult(success=True)
 
+    # Bounded, jittered retries: unbounded lock-step retries from N concurrent
+    # workers would hammer data.worldpop.org in a thundering herd whenever the
+    # server has a transient outage. HTTPError covers both failure responses
+    # and transport-level errors (e.g. broken streams) in httpx. Permanent
+    # client errors (e.g. a 404 for a year/ISO3 asset that does not exist)
+    # surface immediately instead of burning the whole retry budget.
+    @backoff.on_exception(
+        backoff.expo,
+        HTTPError,
+        max_tries=8,
+        max_time=300,
+        jitter=backoff.full_jitter,
+        giveup=lambda e: (
+            isinstance(e, httpx.HTTPStatusError)
+            and e.response.status_code < 500
+            and e.response.status_code not in (408, 429)
+        ),
+    )
+    async def _astream_to_file(self, client, remote_path, tmp_path, pbar=None):
+        """
+        Stream a single remote file to a temporary local path, retrying
+        failed transfers with exponential backoff.
+
+        Parameters
+        ----------
+        client : httpx.AsyncClient
+            The shared HTTP client over which to stream the download.
+        remote_path : str
+            The remote path to the WorldPop raster file to be downloaded.
+        tmp_path : Path
+            The temporary local path to which to stream the file.
+        pbar : tqdm.tqdm, optional
+            A shared progress bar tracking aggregate downloaded bytes. Its
+            total is grown by this file's Content-Length once known (totals
+            are best-effort and may drift slightly when transfers are
+            retried).
+        """
+        remote_url = f"{self.URL}/{remote_path}"
+
+        # If a partial file survives from an interrupted transfer, ask the
+        # server to resume from its last byte rather than restarting at zero.
+        start = tmp_path.stat().st_size if tmp_path.is_file() else 0
+        headers = {"Range": f"bytes={start}-"} if start > 0 else None
+
+        async with client.stream("GET", remote_url, headers=headers) as response:
+            if start > 0 and response.status_code == 416:
+                # the partial file cannot be resumed (e.g. it is already
+                # complete or the remote file changed): restart from scratch
+                tmp_path.unlink()
+                return await self._astream_to_file(client, remote_path, tmp_path, pbar)
+
+            response.raise_for_status()
+
+            if response.status_code != 206:
+                # server refused or ignored the range request
+                start = 0
+
+            # chunked-transfer responses carry no Content-Length
+            remaining = int(response.headers.get("Content-Length", 0)) or None
+
+            if pbar is not None and remaining:
+                pbar.total = (pbar.total or 0) + remaining
+                pbar.refresh()
+
+            if start > 0:
+                # Resume in place: open for update and position the stream
+                # at the resume offset. Append mode must not be used here,
+                # because the preallocation below extends the file past its
+                # current end and appended bytes would land after that
+                # zero-filled padding.
+                f = open(tmp_path, "r+b", buffering=WRITE_BUFFER_SIZE)
+                f.seek(start)
+            else:
+                f = open(tmp_path, "wb", buffering=WRITE_BUFFER_SIZE)
+
+            with f:
+                if remaining and hasattr(os, "posix_fallocate"):
+                    # preallocate the full extent so the kernel can lay the
+                    # raster out contiguously despite many parallel writers
+                    try:
+                        os.posix_fallocate(f.fileno(), start, remaining)
+                    except OSError:
+                        pass  # not supported by this file system
+                try:
+                    async for chunk in response.aiter_raw(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        if pbar is not None:
+                            pbar.update(len(chunk))
+                finally:
+                    # drop any preallocated padding beyond the last byte
+                    # actually written, so the on-disk size stays a truthful
+                    # resume offset even after an interrupted transfer
+                    f.truncate()
+
+    def _get_batch_download_sizes(self, batch):
+        """
+        Check the required download size for a batch of files inside a single
+        worker dispatch, reusing the shared HTTP client.
+
+        Parameters
+        ----------
+        batch : list of tuple
+            One (remote_path, local_path, skip_download_if_exists) tuple
+            per file.
+
+        Returns
+        -------
+        list of DownloadResult
+        """
+        return [self._get_required_file_download_size(*tup) for tup in batch]
+
     def _get_required_file_download_size(
             self,
             remote_path,
@@ -287,12 +737,12 @@ class WorldPopDownloader:
             did not raise a httpx.HTTPStatusError. Otherwise, the error message (str).
 
         """
-        if local_path.exists() and skip_download_if_exists:
+        if skip_download_if_exists and local_path in self._present:
             return DownloadResult(success=True, value=0)
 
         try:
             remote_url = f"{self.URL}/{remote_path}"
-            response = httpx.head(remote_url, follow_redirects=True)
+            response = self._client.head(remote_url, follow_redirects=True)
             response.raise_for_status()
             size = int(response.headers.get("Content-Length", 0))
         except Exception as e:
@@ -300,15 +750,61 @@ class WorldPopDownloader:
         else:
             return DownloadResult(success=True, value=size)
 
-    def _build_local_fpath(self, product_name, iso3, year=None):
-        """Return the local file path used to store a single downloaded Worldpop raster"""
+    def _build_local_fpaths(self, filtered_mdf):
+        """
+        Return the local file paths used to store the downloaded Worldpop
+        rasters described by a filtered manifest.
 
-        if pd.isnull(year):  # catches both None and np.NaN
-            fname = f'{product_name}_{iso3}.tif'
-        else:
-            fname = f'{product_name}_{iso3}_{int(year)}.tif'
+        File names are assembled with vectorized pandas string operations,
+        which is considerably faster than per-row formatting when the
+        manifest selection spans thousands of datasets.
+
+        Parameters
+        ----------
+        filtered_mdf : pandas.DataFrame
+            The filtered manifest (see `wp_manifest_constrained`).
+
+        Returns
+        -------
+        list of pathlib.Path
+        """
+        fnames = filtered_mdf['product_name'].astype(str) + '_' + filtered_mdf['iso3'].astype(str)
+
+        has_year = filtered_mdf['year'].notna()  # catches both None and np.NaN
+        if has_year.any():
+            year_tags = '_' + filtered_mdf.loc[has_year, 'year'].astype(int).astype(str)
+            fnames.loc[has_year] = fnames.loc[has_year] + year_tags
+
+        return [self.directory / f'{fname}.tif' for fname in fnames]
+
+
+def _iter_files(root, suffix=None):
+    """
+    Recursively yield all files below `root` as `os.DirEntry` objects,
+    optionally filtered by file suffix.
+
+    Unlike `Path.glob('**/*')`, this reuses the directory-entry metadata
+    returned by `os.scandir` and thus avoids extra `stat` calls and `Path`
+    object allocations for every file in the tree.
+
+    Parameters
+    ----------
+    root : Path
+        The directory below which to search for files.
+    suffix : str, optional
+        If given, only yield files whose name ends with this suffix.
+    """
+    if not root.is_dir():
+        return
 
-        return self.directory / fname
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif suffix is None or entry.name.endswith(suffix):
+                    yield entry
 
 
 def purge_cache(dry_run=True, keep_country_borders=False):
@@ -331,41 +827,36 @@ def purge_cache(dry_run=True, keep_country_borders=False):
         Summary of how many files and total size (bytes) would be or were deleted.
     """
     cache_dir = get_cache_dir()
-    fpaths = list(cache_dir.glob('**/*'))
 
-    total_size = num_matched = num_deleted = 0
-    for path in fpaths:
-        if keep_country_borders and 'level0' in path.name:
+    total_size = 0
+    matched_paths = []
+    for entry in _iter_files(cache_dir):
+        if keep_country_borders and 'level0' in entry.name:
             continue
 
-        num_matched += 1
-        total_size += path.stat().st_size
+        matched_paths.append(entry.path)
+        total_size += entry.stat().st_size
 
-        if not dry_run:
+    num_deleted = 0
+    if not dry_run and matched_paths:
+        # File deletion is I/O-latency bound and releases the GIL, so
+        # overlapping the unlink syscalls in a small thread pool helps on
+        # slow (e.g. networked) cache file systems.
+        def _unlink(path):
             try:
-                path.unlink()
-                num_deleted += 1
+                os.unlink(path)
+                return True
             except Exception as e:
                 print(f"Failed to delete cached file at {path}: {e}")
+                return False
+
+        max_workers = min(16, get_max_concurrency())
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            num_deleted = sum(executor.map(_unlink, matched_paths))
 
     return {
         "dry_run": dry_run,
-        "matched_files": num_matched,
+        "matched_files": len(matched_paths),
         "deleted_files": num_deleted,
         "total_size_mb": round(total_size / 1e6, 2),
     }
-
-
-def _repair_cache():
-    """
-    Delete all files ending on '.download' in the local cache directory
-    and any of its subdirectories.
-    """
-    cache_dir = get_cache_dir()
-    fpaths = list(cache_dir.glob('**/*.download'))
-
-    for path in fpaths:
-        try:
-            path.unlink()
-        except Exception as e:
-            print(f"Failed to delete cached file at {path}: {e}")
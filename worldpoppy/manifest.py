@@ -12,7 +12,10 @@ Main methods
 import ftplib
 import hashlib
 import logging
+import os
 import re
+import threading
+import time
 from datetime import datetime
 from functools import lru_cache
 from io import BytesIO
@@ -20,6 +23,8 @@ from pathlib import Path
 from socket import gaierror
 from tempfile import NamedTemporaryFile
 
+import backoff
+import numpy as np
 import pandas as pd
 
 from worldpoppy.config import ASSET_DIR
@@ -32,14 +37,33 @@ __all__ = [
     "get_static_product_names",
     "get_all_dataset_names",
     "extract_year",
+    "extract_years",
 ]
 
 FIRST_YEAR = 2000
 
+# How long (in seconds) a previously verified local manifest is trusted
+# before its hash is checked against the WorldPop FTP server again.
+MANIFEST_TTL_SECS = 24 * 3600
+
 _year_pattern = re.compile(r'_\d{4}')
+_year_pattern_grouped = re.compile(r'_(\d{4})')
 _raw_hash_fpath = ASSET_DIR / 'raw_manifest_hash.txt'
 _cleaned_manifest_fpath = ASSET_DIR / 'manifest.feather'
 
+# in-process manifest cache, keyed by the Feather file's mtime. The lock
+# ensures that concurrent first-time callers (e.g. threaded merges) trigger
+# at most one manifest build and one Feather read.
+_manifest_cache = None
+_manifest_lock = threading.Lock()
+
+# FTP transfer block size. ftplib's 8 KiB default forces many Python-level
+# callback invocations per file; 1 MiB keeps the loop mostly in C.
+FTP_BLOCK_SIZE = 1 << 20
+
+# per-thread persistent FTP connection (FTP clients are not thread-safe)
+_ftp_local = threading.local()
+
 logger = logging.getLogger(__name__)
 
 
@@ -98,6 +122,10 @@ def wp_manifest(product_name=None, iso3_codes=None, years=None):
 
     if isinstance(iso3_codes, str):
         iso3_codes = [iso3_codes]
+    elif iso3_codes is not None:
+        # dedupe while preserving order, so repeated codes cannot yield
+        # duplicated manifest rows via the indexed lookup below
+        iso3_codes = list(dict.fromkeys(iso3_codes))
 
     if isinstance(years, int):
         years = [years]
@@ -110,20 +138,43 @@ def wp_manifest(product_name=None, iso3_codes=None, years=None):
                     f"Ignoring the 'years' argument since '{product_name}' is a static WorldPop product"
                 )
                 years = None
-        mdf = mdf[mdf['product_name'] == product_name].copy()
 
     if iso3_codes is not None:
         _validate_isos(iso3_codes)
-        mdf = mdf[mdf['iso3'].isin(iso3_codes)].copy()
+
+    if product_name is not None and iso3_codes is not None:
+        # Fast path for the common constrained query: pull the requested
+        # (product, country) pairs straight from the pre-indexed manifest
+        # instead of scanning all rows twice with boolean masks.
+        idx_mdf = _indexed_manifest()
+        pairs = [
+            (product_name, iso) for iso in iso3_codes
+            if (product_name, iso) in idx_mdf.index
+        ]
+        if pairs:
+            mdf = idx_mdf.loc[pairs].reset_index(drop=True)
+        else:
+            mdf = mdf.iloc[:0]
+    else:
+        if product_name is not None:
+            mdf = mdf[mdf['product_name'] == product_name]
+        if iso3_codes is not None:
+            mdf = mdf[mdf['iso3'].isin(iso3_codes)]
 
     if years is not None:
         _validate_years(years)
         if isinstance(years, list):
-            mdf = mdf[mdf['year'].isin(years)].copy()
-            mdf['year'] = mdf.year.astype(int)
+            mdf = mdf[mdf['year'].isin(years)]
         else:
             assert years == 'all'
-            mdf = mdf[mdf['is_annual']].copy()  # drop static products
+            mdf = mdf[mdf['is_annual']]  # drop static products
+
+    # copy only once, at the end: this detaches the (much smaller) result
+    # from the cached manifest without materialising every intermediate
+    # filter step
+    mdf = mdf.copy()
+    if isinstance(years, list):
+        mdf['year'] = mdf.year.astype(int)
 
     return mdf
 
@@ -167,6 +218,10 @@ def wp_manifest_constrained(product_name, iso3_codes, years=None):
 
     if isinstance(iso3_codes, str):
         iso3_codes = [iso3_codes]
+    else:
+        # dedupe while preserving order, so repeated codes do not inflate
+        # the expected row count in the coverage check below
+        iso3_codes = list(dict.fromkeys(iso3_codes))
 
     if isinstance(years, int):
         years = [years]
@@ -201,7 +256,9 @@ def wp_manifest_constrained(product_name, iso3_codes, years=None):
 
         num_expected = len(iso3_codes) * len(years)
         if len(filtered_mdf) < num_expected:
-            available_grps = filtered_mdf.groupby('iso3').year.unique()
+            # observed=True: only report countries present in the selection
+            # (iso3 is categorical, covering all countries in the manifest)
+            available_grps = filtered_mdf.groupby('iso3', observed=True).year.unique()
 
             raise ValueError(
                 f"Data product '{product_name}' is not available for all combinations "
@@ -242,12 +299,28 @@ def build_wp_manifest(overwrite=False):
     - The cleaned manifest includes metadata to distinguish annually updated WorldPop datasets
       from static datasets. Whether a dataset is annual or static is inferred from the dataset's
       name.
+
+    Raises
+    ------
+    ValueError
+        - If the freshly built manifest contains duplicated entries.
+        - If the manifest implies that not all country rasters use the .tif format.
     """
+    force_refresh = os.getenv("WORLDPOPPY_FORCE_MANIFEST_REFRESH", "0") == "1"
+
     if _cleaned_manifest_fpath.is_file() and not overwrite:
         # Check whether the local manifest is up-to-date.
         # Note: the hash is computed on the raw WorldPop CSV file.
         if _raw_hash_fpath.is_file():
+            # A hash verified within the TTL window is trusted outright,
+            # sparing every fresh Python process the FTP round-trip. Set
+            # WORLDPOPPY_FORCE_MANIFEST_REFRESH=1 to check regardless.
+            hash_age = time.time() - _raw_hash_fpath.stat().st_mtime
+            if not force_refresh and hash_age < MANIFEST_TTL_SECS:
+                return None
+
             if _read_local_manifest_hash() == _fetch_remote_manifest_hash():
+                _raw_hash_fpath.touch()  # restart the TTL window
                 return None
 
     # download the raw manifest CSV from the WorldPop website,
@@ -270,24 +343,56 @@ def build_wp_manifest(overwrite=False):
         'notes',
     ]
 
-    # distinguish between annually updated datasets and static datasets
-    mdf['is_annual'] = mdf.dataset_name.apply(_looks_like_annual_name)
+    # Distinguish between annually updated datasets and static datasets using
+    # vectorized string kernels rather than per-row Python calls. The logic
+    # mirrors `extract_year`: a dataset counts as annual if its name contains
+    # exactly one plausible year identifier.
+    years = pd.to_numeric(mdf.dataset_name.str.extract(_year_pattern_grouped, expand=False))
+    num_year_tags = mdf.dataset_name.str.count(_year_pattern)
+    mask = (
+            (num_year_tags == 1)
+            & years.ge(FIRST_YEAR)
+            & years.le(datetime.now().year)
+    )
+    mdf['is_annual'] = mask
 
     # Make a data product name. For static WorldPop datasets, this is simply the dataset
     # name. For annual datasets, this is the dataset name with year identifier removed.
-    mask = mdf.is_annual
-    mdf['product_name'] = mdf.dataset_name
-    mdf.loc[mask, 'product_name'] = mdf.loc[mask, 'dataset_name'].apply(_strip_year)
+    mdf['product_name'] = mdf.dataset_name.where(
+        ~mask, mdf.dataset_name.str.replace(_year_pattern, '', regex=True)
+    )
 
-    # extract the year for all annual raster datasets
-    mdf['year'] = None
-    mdf.loc[mask, 'year'] = mdf.loc[mask, 'dataset_name'].apply(extract_year)
+    # extract the year for all annual raster datasets (NaN for static ones)
+    mdf['year'] = years.where(mask)
 
     # extract the raster's remote file name
-    mdf['remote_fname'] = [x[-1] for x in mdf.remote_path.str.split('/').values]
+    mdf['remote_fname'] = mdf.remote_path.str.rpartition('/')[2]
+
+    # Dictionary-encode the low-cardinality string columns before writing.
+    # This shrinks the stored manifest several-fold and makes downstream
+    # equality and isin filters integer compares instead of string compares.
+    # 'year' stays float64 so static datasets keep their NaN entries.
+    for col in ('iso3', 'country_name', 'country_numeric', 'product_name'):
+        mdf[col] = mdf[col].astype('category')
+    mdf['is_annual'] = mdf['is_annual'].astype(bool)
+
+    # Sanity-check the cleaned manifest once, at build time. These are
+    # invariants of the build itself, so there is no need to re-verify
+    # them on every cached load.
+    if mdf.duplicated(['dataset_name', 'iso3']).any():
+        raise ValueError(
+            'Bad manifest! There should be no duplicated WorldPop datasets '
+            'at the country level.'
+        )
+
+    raster_formats = mdf.remote_path.str.rpartition('.')[2].unique()
+    if set(raster_formats) != {'tif'}:
+        raise ValueError(
+            'Unexpected file formats in manifest! All raster datasets should be .tif files.'
+        )
 
     # store cleaned manifest for re-use
-    mdf.to_feather(_cleaned_manifest_fpath)
+    mdf.to_feather(_cleaned_manifest_fpath, compression='lz4')
 
     logger.warning(
         f'Cleaned WorldPop data manifest has been stored locally at: {_cleaned_manifest_fpath}'
@@ -296,6 +401,34 @@ def build_wp_manifest(overwrite=False):
     return mdf
 
 
+def _read_manifest_columns(cols):
+    """
+    Return only the requested columns of the cleaned manifest.
+
+    Serves the slice from the in-process cache when the full manifest has
+    already been loaded. Otherwise, reads just the requested columns from
+    the Feather file, which spares callers that only need a code list from
+    paying for the large free-text 'notes' column.
+
+    Parameters
+    ----------
+    cols : tuple of str
+        Names of the manifest columns to return.
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    with _manifest_lock:
+        build_wp_manifest()  # trigger auto-update of local manifest where necessary
+
+        mtime = _cleaned_manifest_fpath.stat().st_mtime
+        if _manifest_cache is not None and _manifest_cache[0] == mtime:
+            return _manifest_cache[1][list(cols)]
+
+    return pd.read_feather(_cleaned_manifest_fpath, columns=list(cols))
+
+
 @lru_cache()
 def get_all_isos():
     """
@@ -305,7 +438,7 @@ def get_all_isos():
     -------
     List[str]
     """
-    uniq = set(wp_manifest()['iso3'])
+    uniq = set(_read_manifest_columns(('iso3',))['iso3'])
     return sorted(uniq)
 
 
@@ -318,7 +451,7 @@ def get_static_product_names():
     -------
     List[str]
     """
-    mdf = wp_manifest()
+    mdf = _read_manifest_columns(('product_name', 'is_annual'))
     uniq = set(mdf[~mdf.is_annual]['product_name'])
     return sorted(uniq)
 
@@ -332,7 +465,7 @@ def get_annual_product_names():
     -------
     List[str]
     """
-    mdf = wp_manifest()
+    mdf = _read_manifest_columns(('product_name', 'is_annual'))
     uniq = set(mdf[mdf.is_annual]['product_name'])
     return sorted(uniq)
 
@@ -346,7 +479,7 @@ def get_all_annual_product_years():
     -------
     List[str]
     """
-    mdf = wp_manifest()
+    mdf = _read_manifest_columns(('year', 'is_annual'))
     uniq = set(mdf[mdf.is_annual]['year'].astype(int))
     return sorted(uniq)
 
@@ -361,10 +494,47 @@ def get_all_dataset_names():
     -------
     List[str]
     """
-    uniq = set(wp_manifest()['dataset_name'])
+    uniq = set(_read_manifest_columns(('dataset_name',))['dataset_name'])
     return sorted(uniq)
 
 
+@lru_cache()
+def _indexed_manifest():
+    """
+    Return the cleaned manifest indexed and sorted by (product_name, iso3).
+
+    Looking up requested (product, country) pairs in this index costs O(k)
+    in the number of requested pairs, rather than one O(N) boolean scan over
+    the full manifest per query.
+    """
+    mdf = _cached_manifest_load()
+    return mdf.set_index(['product_name', 'iso3'], drop=False).sort_index()
+
+
+@lru_cache()
+def _iso_set():
+    """Frozen set of all known ISO3 codes (internal fast path)."""
+    return frozenset(get_all_isos())
+
+
+@lru_cache()
+def _static_product_set():
+    """Frozen set of all static product names (internal fast path)."""
+    return frozenset(get_static_product_names())
+
+
+@lru_cache()
+def _annual_product_set():
+    """Frozen set of all annual product names (internal fast path)."""
+    return frozenset(get_annual_product_names())
+
+
+@lru_cache()
+def _annual_year_set():
+    """Frozen set of all available annual-product years (internal fast path)."""
+    return frozenset(get_all_annual_product_years())
+
+
 def extract_year(dataset_name):
     """
     Extract the year identifier from the name of an annual WorldPop dataset.
@@ -406,40 +576,60 @@ def extract_year(dataset_name):
     return year
 
 
-@lru_cache()
+def extract_years(names):
+    """
+    Extract the year identifiers from many dataset or file names at once.
+
+    This is the bulk companion to `extract_year`: it uses a single
+    precompiled pattern and skips the per-name validation and exception
+    machinery, which dominate when thousands of raster names are parsed
+    in a loop.
+
+    Parameters
+    ----------
+    names : Sequence[str]
+        Dataset names or file names of WorldPop rasters.
+
+    Returns
+    -------
+    numpy.ndarray
+        The first year identifier found in each name (dtype int16), or -1
+        for names without one.
+    """
+    out = np.empty(len(names), dtype=np.int16)
+    for i, name in enumerate(names):
+        matched = _year_pattern_grouped.search(name)
+        out[i] = int(matched.group(1)) if matched else -1
+    return out
+
+
 def _cached_manifest_load():
     """
     Load the cleaned WorldPop manifest from local storage.
 
     Ensures the local manifest file is up-to-date by calling `build_wp_manifest()`.
+    The loaded DataFrame is memoized per process, keyed by the Feather file's
+    mtime, so a manifest rebuilt mid-process is picked up while repeat loads
+    stay free.
 
     Returns
     ------
     pandas.DataFrame
         The cleaned local manifest containing metadata about all WorldPop raster datasets.
-
-    Raises
-    ------
-    ValueError
-        - If the manifest contains duplicated entries.
-        - If the manifest implies that not all country rasters use the .tif format.
     """
-    build_wp_manifest()  # trigger auto-update of local manifest upon first (uncached) function call
-    mdf = pd.read_feather(_cleaned_manifest_fpath)
+    global _manifest_cache
 
-    if mdf.duplicated(['dataset_name', 'iso3']).any():
-        raise ValueError(
-            'Bad manifest! There should be no duplicated WorldPop datasets '
-            'at the country level.'
-        )
+    with _manifest_lock:
+        build_wp_manifest()  # trigger auto-update of local manifest where necessary
 
-    raster_formats = [x[-1] for x in mdf.remote_path.str.split('.').values]
-    if set(raster_formats) != {'tif'}:
-        raise ValueError(
-            'Unexpected file formats in manifest! All raster datasets should be .tif files.'
-        )
+        mtime = _cleaned_manifest_fpath.stat().st_mtime
+        if _manifest_cache is not None and _manifest_cache[0] == mtime:
+            return _manifest_cache[1]
 
-    return mdf
+        mdf = pd.read_feather(_cleaned_manifest_fpath)
+
+        _manifest_cache = (mtime, mdf)
+        return mdf
 
 
 def is_annual_product(product_name):
@@ -472,9 +662,9 @@ def is_annual_product(product_name):
             "more years of interest."
         )
 
-    if product_name in get_static_product_names():
+    if product_name in _static_product_set():
         is_annual = False
-    elif product_name in get_annual_product_names():
+    elif product_name in _annual_product_set():
         is_annual = True
     else:
         raise ValueError(
@@ -502,7 +692,7 @@ def _validate_isos(iso3_codes):
         If the check fails, i.e., if WorldPop has no data whatsoever for one
         or more of the requested countries.
     """
-    if unknown_isos := set(iso3_codes) - set(get_all_isos()):
+    if unknown_isos := set(iso3_codes) - _iso_set():
         raise ValueError(
             f'WorldPop has no data for the following country codes: {unknown_isos}. '
             f'You can list all available country codes as follows:\n\n'
@@ -534,7 +724,7 @@ def _validate_years(years):
                 f"passed the type {type(years)} instead."
             )
     else:
-        if unknown_years := set(years) - set(get_all_annual_product_years()):
+        if unknown_years := set(years) - _annual_year_set():
             raise ValueError(
                 f'WorldPop has no annual data whatsoever for the following years: '
                 f'{unknown_years}. You can list all available years as follows:\n\n'
@@ -576,19 +766,24 @@ def _looks_like_annual_name(dataset_name):
     -------
     bool
     """
-    is_annual = True
-    try:
-        extract_year(dataset_name)
-    except ValueError:
-        is_annual = False
+    # same check as `extract_year`, but expressed as a plain boolean
+    # test: raising and catching a ValueError per non-annual name is
+    # far more expensive than inspecting the match directly
+    matched = _year_pattern.findall(dataset_name)
+    if len(matched) != 1:
+        return False
 
-    return is_annual
+    year = int(matched[0][1:])
+    return FIRST_YEAR <= year <= datetime.now().year
 
 
 def _get_file_md5_hash(fpath):
     """
     Compute the MD5 hash of a file.
 
+    The hash is only used as an integrity check against the checksum
+    published by WorldPop, not for any cryptographic purpose.
+
     Parameters
     ----------
     fpath : str or Path
@@ -599,14 +794,86 @@ def _get_file_md5_hash(fpath):
     str
         The hexadecimal MD5 hash of the file contents.
     """
-    hasher = hashlib.md5()
     with open(fpath, 'rb') as f:
-        # read file in chunks to handle large files
-        for chunk in iter(lambda: f.read(4096), b''):
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'md5').hexdigest()
+
+        # fall back to hashing in large chunks, keeping the loop mostly in C
+        hasher = hashlib.md5()
+        while chunk := f.read(1 << 20):
             hasher.update(chunk)
-    return hasher.hexdigest()
+        return hasher.hexdigest()
+
 
+def _get_ftp_client(server, login, pwd):
+    """
+    Return a persistent, per-thread FTP client, connecting (or reconnecting)
+    where necessary.
 
+    Reusing the control connection across calls avoids a fresh TCP and FTP
+    authentication handshake per transferred file. A cheap NOOP probe detects
+    connections that have been closed by the server in the meantime.
+
+    Parameters
+    ----------
+    server : str
+        The FTP server address.
+    login : str
+        The FTP login username.
+    pwd : str
+        The FTP login password.
+
+    Returns
+    -------
+    ftplib.FTP
+
+    Raises
+    ------
+    ValueError
+        If there is an issue connecting to the FTP server.
+    """
+    cached = getattr(_ftp_local, 'client', None)
+    if cached is not None and getattr(_ftp_local, 'server', None) == server:
+        try:
+            cached.voidcmd('NOOP')  # keepalive probe
+            return cached
+        except Exception:
+            close_ftp_client()
+
+    # instantiate a fresh FTP client
+    try:
+        ftp_client = ftplib.FTP(server, login, pwd, timeout=20)
+    except gaierror:
+        raise ValueError(
+            f"WorldPop FTP server '{server}' is unknown. Please check the server address."
+        )
+    except Exception as e:
+        raise ValueError(
+            f'Could not connect to the WorldPop FTP server. Error: {e}'
+        )
+
+    _ftp_local.client = ftp_client
+    _ftp_local.server = server
+    return ftp_client
+
+
+def close_ftp_client():
+    """Close the calling thread's persistent FTP connection, if any."""
+    cached = getattr(_ftp_local, 'client', None)
+    if cached is not None:
+        try:
+            cached.quit()
+        except Exception:  # noqa; the connection may already be dead
+            pass
+        _ftp_local.client = None
+        _ftp_local.server = None
+
+
+@backoff.on_exception(
+    backoff.expo,
+    (ftplib.error_temp, EOFError, ConnectionError),
+    max_tries=3,
+)
 def _worldpop_ftp_download(
         remote_fpath,
         local_fpath=None,
@@ -615,7 +882,11 @@ def _worldpop_ftp_download(
         pwd=''
 ):
     """
-    Download a file from the WorldPop FTP server.
+    Download a file from the WorldPop FTP server, reusing a persistent
+    per-thread connection across calls.
+
+    Transient FTP errors are retried with exponential backoff on a fresh
+    connection.
 
     Parameters
     ----------
@@ -643,29 +914,28 @@ def _worldpop_ftp_download(
     ValueError
         If there is an issue connecting to the FTP server.
     """
+    ftp_client = _get_ftp_client(server, login, pwd)
 
-    # instantiate an FTP client
     try:
-        ftp_client = ftplib.FTP(server, login, pwd, timeout=20)
-    except gaierror:
-        raise ValueError(
-            f"WorldPop FTP server '{server}' is unknown. Please check the server address."
-        )
-    except Exception as e:
-        raise ValueError(
-            f'Could not connect to the WorldPop FTP server. Error: {e}'
-        )
-
-    if local_fpath is None:
-        # download the remote file directly into memory
-        byte_stream = BytesIO()
-        ftp_client.retrbinary(f"RETR {remote_fpath}", byte_stream.write)
-        byte_stream.seek(0)
-        return byte_stream
+        if local_fpath is None:
+            # download the remote file directly into memory
+            byte_stream = BytesIO()
+            ftp_client.retrbinary(
+                f"RETR {remote_fpath}", byte_stream.write, blocksize=FTP_BLOCK_SIZE
+            )
+            byte_stream.seek(0)
+            return byte_stream
 
-    # download remote file to the local disk
-    with open(local_fpath, 'wb') as file:
-        ftp_client.retrbinary(f"RETR {remote_fpath}", file.write)
+        # download remote file to the local disk
+        with open(local_fpath, 'wb') as file:
+            ftp_client.retrbinary(
+                f"RETR {remote_fpath}", file.write, blocksize=FTP_BLOCK_SIZE
+            )
+    except Exception:
+        # a failed transfer can leave the control connection in an undefined
+        # state; drop it so any retry starts from a clean connection
+        close_ftp_client()
+        raise
 
 
 def _fetch_remote_manifest_hash():
@@ -25,27 +25,48 @@ Main methods
 """
 
 import logging
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import List, Tuple
 
 import geopandas as gpd
+import numpy as np
+import rasterio
 import rioxarray
 import shapely
 import xarray as xr
 from pyproj import CRS, Transformer
+from rioxarray.exceptions import NoDataInBounds, OneDimensionalRaster
 from rioxarray.merge import merge_arrays
 from tqdm.auto import tqdm
 
 from worldpoppy.borders import load_country_borders
 from worldpoppy.config import *
 from worldpoppy.download import WorldPopDownloader
-from worldpoppy.manifest import extract_year
+from worldpoppy.manifest import extract_years, wp_manifest_constrained
 from worldpoppy.utils import module_available, geolocate_name
 
+# checked once at import: whether the optional `bottleneck` accelerator
+# for xarray is installed. The install hint is only logged once per process.
+_HAS_BOTTLENECK = module_available("bottleneck")
+_bottleneck_hint_logged = False
+
 logger = logging.getLogger(__name__)
 
+# downloader instances (with their pooled HTTP/2 connections) reused across
+# wp_raster calls that target the same cache directory
+_downloader_cache = {}
+
+
+def _get_downloader(directory):
+    """Return a shared `WorldPopDownloader` for the given directory."""
+    key = str(directory)
+    if key not in _downloader_cache:
+        _downloader_cache[key] = WorldPopDownloader(directory=directory)
+    return _downloader_cache[key]
+
 __all__ = [
     "RasterReadError",
     "IncompatibleRasterError",
@@ -80,6 +101,9 @@ def wp_raster(
     res=None,
     download_dry_run=False,
     to_crs=None,
+    parallel_years=None,
+    chunks=None,
+    out_dtype=None,
     **merge_kwargs,
 ):
     """
@@ -140,6 +164,23 @@ def wp_raster(
         Coordinate reference system (CRS) to reproject the merged raster into.
         Re-projection is applied *after* merging (and clipping, if requested).
         If `to_crs` is not provided, raster data remains in the source CRS.
+    parallel_years : int, optional
+        Cap on the number of years whose rasters are merged concurrently
+        for annual products. Defaults to at most eight concurrent years.
+    chunks : int, tuple or dict, optional
+        Chunk sizes along each dimension, e.g. ``{'x': 2048, 'y': 2048}``.
+        If given, input rasters are opened as lazy, dask-backed arrays and
+        the merged result is only materialised on `.compute()` (or by
+        operations that require the data). This keeps peak memory bounded
+        for continent-scale AOIs. Requires the optional `dask` package
+        and `cache_downloads=True`, since the lazy result reads from the
+        downloaded files only when computed.
+    out_dtype : str or numpy.dtype, optional
+        Data type of the returned raster, applied as a single cast at the
+        end of each merge. By default, data keeps the dtype produced by
+        the read (the native on-disk dtype unless `masked` or
+        `mask_and_scale` force a float promotion). Note that NaN masking
+        requires a float dtype.
     **merge_kwargs : keyword arguments
         Additional arguments passed to
         `rioxarray.merge.merge_arrays <https://corteva.github.io/rioxarray/stable/rioxarray.html#rioxarray.merge.merge_arrays>`_,
@@ -186,6 +227,16 @@ def wp_raster(
                 )
             iso3_codes = aoi
 
+    if chunks is not None and not cache_downloads:
+        # With `cache_downloads=False`, source files live in a temporary
+        # directory that is deleted on return. A lazy, dask-backed result
+        # would still reference those files and fail on `.compute()`.
+        raise ValueError(
+            "Lazy reads via 'chunks' require 'cache_downloads=True', since "
+            "chunked results are only read from disk after the temporary "
+            "download directory has been deleted."
+        )
+
     if not cache_downloads and skip_download_if_exists:
         skip_download_if_exists = False
         logger.warning(
@@ -201,53 +252,126 @@ def wp_raster(
         res=res,
         clipping_gdf=clipping_gdf,
         to_crs=to_crs,
+        chunks=chunks,
+        out_dtype=out_dtype,
     )
     shared_merge_opts.update(**merge_kwargs)
 
     with TemporaryDirectory() if not cache_downloads else get_cache_dir() as d:
-        # download all required rasters
-        all_raster_paths = WorldPopDownloader(directory=d).download(
-            product_name,
-            iso3_codes,
-            years,
-            skip_download_if_exists,
-            dry_run=download_dry_run,
-        )
+        # Reuse one downloader per cache directory so its pooled HTTP/2
+        # connections survive across wp_raster calls. Temporary directories
+        # still get a throwaway instance.
+        downloader = _get_downloader(d) if cache_downloads else WorldPopDownloader(directory=d)
+
+        if years is None or download_dry_run:
+            # download all required rasters
+            all_raster_paths = downloader.download(
+                product_name,
+                iso3_codes,
+                years,
+                skip_download_if_exists,
+                dry_run=download_dry_run,
+            )
 
-        if download_dry_run:
-            return None
+            if download_dry_run:
+                return None
 
-        if years is None:
             # static product: merge only once
             merged = merge_rasters(all_raster_paths, **shared_merge_opts)
             return merged.squeeze()
 
-        # annual product
-        # > split raster paths by year
-        paths_by_year = defaultdict(list)
-        for path in all_raster_paths:
-            year = extract_year(path.name)
-            paths_by_year[year].append(path)
+        # Annual product: pipeline downloads and merges. The manifest says
+        # how many country rasters each year needs, so a year's merge is
+        # submitted to the pool the moment its last file lands, while later
+        # years are still downloading. Per-year inputs are sorted so the
+        # completion-ordered stream never changes what merge_arrays sees.
+        request_mdf = wp_manifest_constrained(product_name, iso3_codes, years)
+        expected_counts = request_mdf.year.astype(int).value_counts().to_dict()
 
-        # > merge rasters separately by year
-        annual_rasters = []
+        max_workers = min(8, len(expected_counts))
+        if parallel_years is not None:
+            max_workers = min(max_workers, max(1, parallel_years))
+
+        pending_paths = {}
+        merged_by_year = {}
         pbar = tqdm(
-            paths_by_year.items(),
-            total=len(paths_by_year),
+            total=len(expected_counts),
             desc="Processing years...",
             leave=False,
         )
-        for year, year_paths in pbar:
-            merged = merge_rasters(year_paths, **shared_merge_opts)
-            merged['year'] = year
-            annual_rasters.append(merged)
-
-        # > stack years
-        time_series = _concat_with_info(
-            annual_rasters,
-            dim='year',
-            combine_attrs='drop_conflicts'
+        with pbar, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            path_stream = downloader.download_iter(
+                product_name,
+                iso3_codes,
+                years,
+                skip_download_if_exists,
+            )
+            for path in path_stream:
+                year = int(extract_years([path.name])[0])
+                pending_paths.setdefault(year, []).append(path)
+                if len(pending_paths[year]) == expected_counts[year]:
+                    year_paths = sorted(pending_paths.pop(year))
+                    future = executor.submit(merge_rasters, year_paths, **shared_merge_opts)
+                    futures[future] = year
+            for future in as_completed(futures):
+                merged_by_year[futures[future]] = future.result()
+                pbar.update()
+
+        years_sorted = sorted(merged_by_year)
+        annual_rasters = [merged_by_year[year] for year in years_sorted]
+
+        # > stack years. All annual mosaics come from the same merge
+        # options and hence normally share one spatial grid, which is
+        # verified below by comparing the x/y coordinates directly. On a
+        # shared grid the stack needs no xarray alignment work at all;
+        # genuinely diverging grids are aligned by a plain concat.
+        first = annual_rasters[0]
+        shared_grid = all(
+            da.shape == first.shape
+            and np.array_equal(da.x.values, first.x.values)
+            and np.array_equal(da.y.values, first.y.values)
+            for da in annual_rasters[1:]
         )
+
+        # intersect the per-year attrs in one linear pass, instead of
+        # letting the concat engine compare every pair of attr dicts
+        # ('drop_conflicts' scales quadratically with the year count)
+        common_attrs = dict(first.attrs)
+        for da in annual_rasters[1:]:
+            common_attrs = {
+                key: val for key, val in common_attrs.items()
+                if key in da.attrs and da.attrs[key] == val
+            }
+
+        if shared_grid and isinstance(first.data, np.ndarray):
+            stacked = np.stack([da.values for da in annual_rasters], axis=0)
+            time_series = xr.DataArray(
+                stacked,
+                coords={'year': years_sorted, **dict(first.coords)},
+                dims=('year', *first.dims),
+                attrs=common_attrs,
+            )
+        else:
+            expanded = [
+                da.expand_dims(year=[year])
+                for year, da in zip(years_sorted, annual_rasters)
+            ]
+            if shared_grid:
+                # dask-backed mosaics on one verified grid: skip the
+                # alignment machinery while keeping the stack lazy
+                concat_opts = dict(join='override', compat='override', coords='minimal')
+            else:
+                # the per-year grids genuinely diverge; let xarray align
+                # them on a common grid via an outer join
+                concat_opts = dict(join='outer')
+            time_series = _concat_with_info(
+                expanded,
+                dim='year',
+                combine_attrs='override',
+                **concat_opts,
+            )
+            time_series.attrs = common_attrs
         return time_series.squeeze()
 
 
@@ -257,7 +381,10 @@ def merge_rasters(
     mask_and_scale=False,
     other_read_kwargs=None,
     clipping_gdf=None,
+    aoi_bounds=None,
     to_crs=None,
+    chunks=None,
+    out_dtype=None,
     **merge_kwargs,
 ):
     """
@@ -285,10 +412,28 @@ def merge_rasters(
         or `band_as_variable`).
     clipping_gdf : geopandas.GeoDataFrame, optional
         GeoDataFrame with geometries used to clip the merged raster.
+    aoi_bounds : array-like of four floats, optional
+        Bounding box (min_x, min_y, max_x, max_y) of the area of interest.
+        If given, each input raster is clipped to this box *before* merging,
+        which keeps the mosaic small when the area of interest covers only
+        a fraction of the input countries. Rasters that do not overlap the
+        box are dropped. Bounds are interpreted in the CRS of `clipping_gdf`
+        if that is given, and in the CRS of the input rasters otherwise.
+        Defaults to the total bounds of `clipping_gdf` when that is given.
     to_crs : str or pyproj.CRS, optional
         Coordinate reference system (CRS) to reproject the merged raster into.
         Re-projection is applied *after* merging (and clipping, if requested).
         If `to_crs` is not provided, raster data remains in the source CRS.
+    chunks : int, tuple or dict, optional
+        Chunk sizes along each dimension, e.g. ``{'x': 2048, 'y': 2048}``.
+        If given, input rasters are opened as lazy, dask-backed arrays and
+        the merged result is only materialised on `.compute()` (or by
+        operations that require the data). Requires the optional `dask`
+        package.
+    out_dtype : str or numpy.dtype, optional
+        Data type of the returned raster, applied as a single cast after
+        merging, clipping and reprojection. Note that NaN masking requires
+        a float dtype.
     **merge_kwargs : keyword arguments
         Additional arguments passed to `rioxarray.merge.merge_arrays`,
         which give more control over how input rasters should be merged
@@ -309,15 +454,48 @@ def merge_rasters(
         - If input rasters have mismatched `_FillValue` or `scale_factor` attributes.
     """
 
-    # read country rasters into a list
-    rasters = []
-    fill_val_ref = None
-    scaling_ref = None
-    crs_ref = None
+    # Prevalidate attribute consistency from cached file metadata: mixed
+    # _FillValue or scale_factor inputs fail here before any full raster
+    # open, and the metadata reads are free on repeat calls over the same
+    # cached files. The post-pass below remains authoritative.
+    if not masked and not mask_and_scale:
+        metas = []
+        for path in raster_fpaths:
+            try:
+                metas.append(_raster_meta(str(path), Path(path).stat().st_mtime))
+            except Exception as e:
+                # keep the canonical read-error contract: missing or corrupt
+                # files surface as RasterReadError with the recovery hint
+                raise RasterReadError(
+                    f"Failed to read raster file at {path}. Error: {e}\n"
+                    "If you suspect a corrupted cache, please try to delete the affected "
+                    "file and trigger the download again."
+                )
+        if len({nodata for nodata, _ in metas if nodata is not None}) > 1:
+            raise IncompatibleRasterError(
+                "Country rasters do not use the same '_FillValue'. Please try again "
+                "with either the 'masked' or 'mask_and_scale' argument set to True."
+            )
+        if len({scale for _, scale in metas if scale is not None}) > 1:
+            raise IncompatibleRasterError(
+                "Country rasters do not use the same 'scale_factor'. Please try again "
+                "with the 'mask_and_scale' argument set to True."
+            )
+
+    if chunks is not None:
+        if not module_available("dask"):
+            raise ImportError(
+                "Chunked (lazy) raster reads require the optional `dask` "
+                "module. (pip install dask)"
+            )
+        other_read_kwargs = dict(other_read_kwargs or {}, chunks=chunks)
 
-    for i, path in enumerate(raster_fpaths):
+    # Read the country rasters in parallel: GDAL releases the GIL during
+    # I/O, so a small thread pool overlaps the per-file metadata reads and
+    # disk stalls. `executor.map` preserves input order.
+    def _open(path):
         try:
-            da = rioxarray.open_rasterio(
+            return rioxarray.open_rasterio(
                 path,
                 masked=masked,
                 mask_and_scale=mask_and_scale,
@@ -330,45 +508,77 @@ def merge_rasters(
                 "file and trigger the download again."
             )
 
-        # ensure consistent CRS
-        this_crs = da.rio.crs
-        if crs_ref is None:
-            crs_ref = this_crs
-        elif this_crs != crs_ref:
-            raise IncompatibleRasterError(
-                f"Input rasters do not share the same CRS. Found mismatch: {this_crs} != {crs_ref}.\n"
-                "Ensure all rasters have the same projection before merging."
-            )
+    max_workers = min(8, max(1, len(raster_fpaths)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        rasters = list(executor.map(_open, raster_fpaths))
 
-        # ensure consistent _FillValue (if any)
-        if '_FillValue' in da.attrs:
-            if fill_val_ref is None:
-                fill_val_ref = da.attrs['_FillValue']
-            else:
-                if da.attrs['_FillValue'] != fill_val_ref:
-                    raise IncompatibleRasterError(
-                        "Country rasters do not use the same '_FillValue'. Please try again "
-                        "with either the 'masked' or 'mask_and_scale' argument set to True."
-                    )
-
-        # ensure consistent scale_factor (if any)
-        if 'scale_factor' in da.attrs:
-            if scaling_ref is None:
-                scaling_ref = da.attrs['scale_factor']
-            else:
-                if da.attrs['scale_factor'] != scaling_ref:
-                    raise IncompatibleRasterError(
-                        "Country rasters do not use the same 'scale_factor'. Please try again "
-                        "with the 'mask_and_scale' argument set to True."
-                    )
+    # post-pass: ensure the collected rasters are mutually compatible
+
+    # ensure consistent CRS
+    unique_crs = {da.rio.crs for da in rasters}
+    if len(unique_crs) > 1:
+        crs_ref, this_crs, *_ = unique_crs
+        raise IncompatibleRasterError(
+            f"Input rasters do not share the same CRS. Found mismatch: {this_crs} != {crs_ref}.\n"
+            "Ensure all rasters have the same projection before merging."
+        )
+
+    # ensure consistent _FillValue (if any)
+    unique_fill_vals = {da.attrs['_FillValue'] for da in rasters if '_FillValue' in da.attrs}
+    if len(unique_fill_vals) > 1:
+        raise IncompatibleRasterError(
+            "Country rasters do not use the same '_FillValue'. Please try again "
+            "with either the 'masked' or 'mask_and_scale' argument set to True."
+        )
+
+    # ensure consistent scale_factor (if any)
+    unique_scalings = {da.attrs['scale_factor'] for da in rasters if 'scale_factor' in da.attrs}
+    if len(unique_scalings) > 1:
+        raise IncompatibleRasterError(
+            "Country rasters do not use the same 'scale_factor'. Please try again "
+            "with the 'mask_and_scale' argument set to True."
+        )
 
-        rasters.append(da)
+    # optional pre-clipping: reduce each raster to the area of interest
+    # *before* merging, so the mosaic never materialises pixels that the
+    # final polygon clip would discard anyway
+    if aoi_bounds is None and clipping_gdf is not None:
+        aoi_bounds = clipping_gdf.total_bounds
+
+    if aoi_bounds is not None:
+        box_crs = clipping_gdf.crs if clipping_gdf is not None else None
+        clipped = []
+        for da in rasters:
+            try:
+                clipped.append(
+                    da.rio.clip_box(*aoi_bounds, allow_one_dimensional_raster=True, crs=box_crs)
+                )
+            except (NoDataInBounds, OneDimensionalRaster):
+                # raster does not overlap the area of interest
+                continue
+        if not clipped:
+            raise ValueError(
+                "None of the input rasters overlap the requested 'aoi_bounds'."
+            )
+        rasters = clipped
 
-    da = merge_arrays(rasters, **merge_kwargs)
+    if len(rasters) == 1 and not any(v is not None for v in merge_kwargs.values()):
+        # single-country fast path: with nothing to mosaic and no merge
+        # options requested (e.g. res or bounds), skip the full-array
+        # copy that merge_arrays would make
+        da = rasters[0]
+    else:
+        da = merge_arrays(rasters, **merge_kwargs)
 
     # optional clipping
     if clipping_gdf is not None:
-        geoms = clipping_gdf.geometry.apply(shapely.geometry.mapping)
+        # dissolve multi-row AOIs into a single (multi)polygon and hand
+        # rio.clip its GeoJSON interface directly, rather than converting
+        # every row with a Python-level apply
+        clip_geoms = clipping_gdf.geometry.values
+        if len(clip_geoms) > 1:
+            clip_geoms = [shapely.union_all(clip_geoms)]
+        geoms = [geom.__geo_interface__ for geom in clip_geoms]
         da = da.rio.clip(geoms, clipping_gdf.crs, drop=True, all_touched=True)
 
     # optional re-projection
@@ -376,6 +586,10 @@ def merge_rasters(
         to_crs = CRS(to_crs)  # force format errors
         da = da.rio.reproject(to_crs)
 
+    # optional final cast
+    if out_dtype is not None:
+        da = da.astype(out_dtype, copy=False)
+
     return da
 
 
@@ -460,6 +674,30 @@ def bbox_from_location(centre, width_degrees=None, width_km=None):
     return min_lon, min_lat, max_lon, max_lat
 
 
+@lru_cache(maxsize=4096)
+def _raster_meta(fpath, mtime):
+    """
+    Return the (nodata value, scale factor) metadata of a raster file.
+
+    Results are memoized per path and file mtime, so repeated `wp_raster`
+    calls over the same cached files (e.g. for adjacent AOIs) answer the
+    consistency prevalidation without re-opening any file. A scale factor
+    of 1 and an absent nodata value are both reported as None, mirroring
+    how `rioxarray` omits the corresponding attributes.
+
+    Parameters
+    ----------
+    fpath : str
+        Path to the raster file.
+    mtime : float
+        The file's modification time, used only as a cache key.
+    """
+    with rasterio.open(fpath) as src:
+        nodata = src.nodata
+        scale = src.scales[0] if src.scales else None
+        return nodata, (scale if scale != 1.0 else None)
+
+
 def _concat_with_info(objs, **kwargs):
     """
     Thin wrapper for `xarray.concat` which logs an info message if the optional
@@ -472,7 +710,10 @@ def _concat_with_info(objs, **kwargs):
     **kwargs : keyword arguments
         Additional arguments passed to `xarray.concat`.
     """
-    if not module_available("bottleneck"):
+    global _bottleneck_hint_logged
+
+    if not _HAS_BOTTLENECK and not _bottleneck_hint_logged:
+        _bottleneck_hint_logged = True
         logger.info(
             "Installing the optional `bottleneck` module may accelerate "
             "`xarray` concatenation. (pip install bottleneck)"
@@ -492,24 +733,29 @@ def _validate_bbox(bbox):
     if not isinstance(bbox, (list, tuple)):
         raise ValueError("Bounding box must be a list or tuple.")
 
-    if len(bbox) != 4 or not all([isinstance(x, (int, float)) for x in bbox]):
+    try:
+        arr = np.asarray(bbox, dtype=float)
+    except (TypeError, ValueError):
+        arr = np.empty(0)
+
+    if arr.shape != (4,):
         raise ValueError(
             "Bounding box must contain exactly four numeric values: "
             "(min_lon, min_lat, max_lon, max_lat)."
         )
 
-    min_lon, min_lat, max_lon, max_lat = bbox
+    min_lon, min_lat, max_lon, max_lat = arr
 
     if min_lon >= max_lon:
         raise ValueError("Bad bounding box. min_lon must be less than max_lon.")
     if min_lat >= max_lat:
         raise ValueError("Bad bounding box. min_lat must be less than max_lat.")
 
-    if not (-180 <= min_lon <= 180 and -180 <= max_lon <= 180):
+    if np.abs(arr[[0, 2]]).max() > 180:
         raise ValueError(
             "Bad bounding box. Longitude must be between -180 and 180 degrees."
         )
-    if not (-90 <= min_lat <= 90 and -90 <= max_lat <= 90):
+    if np.abs(arr[[1, 3]]).max() > 90:
         raise ValueError(
             "Bad bounding box. Latitude must be between -90 and 90 degrees."
         )
@@ -2,7 +2,9 @@
 Collection of various helper functions.
 """
 
+import shelve
 from functools import lru_cache
+from importlib.util import find_spec
 from typing import Tuple
 
 import backoff
@@ -11,7 +13,7 @@ from geopy.geocoders import Nominatim
 from matplotlib import pyplot as plt
 from pyproj import Transformer
 
-from worldpoppy.config import WGS84_CRS
+from worldpoppy.config import WGS84_CRS, get_cache_dir
 from worldpoppy.manifest import get_all_isos
 
 __all__ = [
@@ -23,13 +25,52 @@ __all__ = [
 ]
 
 
-@lru_cache(maxsize=1024)
+def _geocode_cache_fpath():
+    """Return the path of the on-disk geocoding cache (sans dbm suffix)."""
+    cache_dir = get_cache_dir()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return str(cache_dir / "geocode_cache")
+
+
 @backoff.on_exception(backoff.expo, GeocoderTimedOut, max_tries=5)
+def _query_nominatim(nomatim_query):
+    """Resolve a location name to (lon, lat) via OSM's 'Nominatim' service."""
+    geolocator = Nominatim(user_agent="MyLocationCacher", timeout=2)
+    located = geolocator.geocode(nomatim_query)
+
+    if located is None:
+        raise RuntimeError(f"Nomatim search for location name '{nomatim_query}' returned no hit.")
+
+    return located.point.longitude, located.point.latitude
+
+
+@lru_cache(maxsize=1024)
+def _geolocate_lonlat(nomatim_query):
+    """
+    Return the WGS84 (lon, lat) coordinate for a location name.
+
+    Hits are memoized in process and persisted in a small `shelve`
+    database inside the WorldPopPy cache directory, so repeated runs in
+    fresh Python sessions skip the Nominatim network round-trip entirely.
+    Failed lookups are never cached.
+    """
+    with shelve.open(_geocode_cache_fpath()) as db:
+        if nomatim_query in db:
+            return db[nomatim_query]
+
+        lon_lat = _query_nominatim(nomatim_query)
+        db[nomatim_query] = lon_lat
+        return lon_lat
+
+
 def geolocate_name(nomatim_query, to_crs=None):
     """
     Return the geo-coordinate associated with a given location name,
     based on search results from OSM's 'Nominatim' service.
 
+    Results are cached on disk, so a location name is only ever geocoded
+    once per machine.
+
     Parameters
     ----------
     nomatim_query : str
@@ -49,13 +90,8 @@ def geolocate_name(nomatim_query, to_crs=None):
     RuntimeError
         If the Nominatim query has returned None.
     """
-    geolocator = Nominatim(user_agent="MyLocationCacher", timeout=2)
-    located = geolocator.geocode(nomatim_query)
+    lon, lat = _geolocate_lonlat(nomatim_query)
 
-    if located is None:
-        raise RuntimeError(f"Nomatim search for location name '{nomatim_query}' returned no hit.")
-
-    lon, lat = located.point.longitude, located.point.latitude
     if to_crs is None:
         return lon, lat
 
@@ -189,11 +225,12 @@ def clean_axis(ax=None, title=None, remove_xy_ticks=False):
         ax.set_yticks([])
 
 
+@lru_cache()
 def module_available(module_name):
-    """Check if a named Python module is available for import."""
-    try:
-        exec(f"import {module_name}")
-    except ModuleNotFoundError:
-        return False
-    else:
-        return True
+    """
+    Check if a named Python module is available for import.
+
+    Uses `importlib.util.find_spec`, which consults the import machinery
+    without executing the module, and caches the answer per name.
+    """
+    return find_spec(module_name) is not None